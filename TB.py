@@ -1,3 +1,4 @@
+import io
 import streamlit as st
 import pandas as pd
 import importlib.util
@@ -8,8 +9,30 @@ st.title("📊 Dynamic Rule-Based Data Verification App")
 st.markdown("""
 Upload your **Python rules file** and the **Excel file** you want to verify.
 The app will dynamically apply the rules and show a validation table.
+
+The rules file must define `check_rules(data)`. For Excel uploads `data` is a
+dict mapping each sheet name to its DataFrame; for CSV uploads it is a single
+DataFrame.
 """)
 
+
+@st.cache_data
+def load_workbook(file_bytes: bytes) -> dict[str, pd.DataFrame]:
+    """Parse every sheet of an uploaded workbook, cached on the file bytes."""
+    try:
+        # calamine parses xlsx several times faster than openpyxl
+        xls = pd.ExcelFile(io.BytesIO(file_bytes), engine="calamine")
+    except (ImportError, ValueError):
+        xls = pd.ExcelFile(io.BytesIO(file_bytes))
+    return {name: xls.parse(name) for name in xls.sheet_names}
+
+
+@st.cache_data
+def load_csv(file_bytes: bytes) -> pd.DataFrame:
+    """Parse an uploaded CSV file, cached on the file bytes."""
+    return pd.read_csv(io.BytesIO(file_bytes))
+
+
 # Upload rules file (.py)
 rules_file = st.file_uploader("Upload your Python rules file (.py)", type=["py"])
 if rules_file:
@@ -27,20 +50,22 @@ data_file = st.file_uploader("Upload Excel file to verify", type=["xlsx", "csv"]
 if data_file and rules_file:
     # Preview logic
     if data_file.name.endswith("xlsx"):
-        xls = pd.ExcelFile(data_file)
-        preview_sheet = xls.sheet_names[0]
-        df_preview = xls.parse(preview_sheet)
+        sheets = load_workbook(data_file.getvalue())
+        preview_sheet = next(iter(sheets))
+        df_preview = sheets[preview_sheet]
+        data = sheets
         st.write(f"Preview of uploaded data (first sheet: {preview_sheet}):")
         st.dataframe(df_preview.head())
     else:
-        df_preview = pd.read_csv(data_file)
+        df_preview = load_csv(data_file.getvalue())
+        data = df_preview
         st.write("Preview of uploaded data:")
         st.dataframe(df_preview.head())
 
     # Apply rules
     try:
-        # Pass file-like object to check_rules
-        results = rules_module.check_rules(data_file)
+        # Pass the already-parsed data so the upload is only read once
+        results = rules_module.check_rules(data)
         if isinstance(results, dict):
             st.markdown("## Validation Results:")
             for k, v in results.items():